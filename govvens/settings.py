@@ -65,13 +65,20 @@ TEMPLATES = [
         'DIRS': [
             BASE_DIR / 'templates'
         ],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Cache parsed templates in memory instead of re-reading and
+            # re-parsing the .html files on every render() call.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -86,6 +93,25 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open between requests instead of paying the
+        # connect cost on every hit; health checks re-verify a recycled
+        # connection before reuse. When this moves to Postgres, front it
+        # with pgbouncer (pool_mode=transaction) so workers share a small
+        # server-side pool.
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+
+# Cache
+# Used for event listings, dashboard statistics and per-user lookups.
+# LocMem is per-process; point this at Redis (e.g. django-redis) for
+# multi-worker deployments so invalidation is shared.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
@@ -147,6 +173,15 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Custom User Model
 AUTH_USER_MODEL = 'user.User'
 
+# Excel export downloads. When EXPORT_ACCEL_PREFIX is set, exports are
+# written under EXPORT_DIR and handed to the front proxy with
+# X-Accel-Redirect so the worker is freed while nginx streams the file;
+# requires a matching internal location, e.g.
+#   location /protected/exports/ { internal; alias <EXPORT_DIR>/; }
+# Left empty, Django streams the file itself via FileResponse.
+EXPORT_ACCEL_PREFIX = os.getenv('EXPORT_ACCEL_PREFIX', '')
+EXPORT_DIR = Path(os.getenv('EXPORT_DIR', BASE_DIR / 'exports'))
+
 # Tracking / telemetry configuration
 TRACKING_VISITOR_COOKIE_NAME = 'gov_visitor_id'
 TRACKING_VISITOR_COOKIE_AGE = 60 * 60 * 24 * 365  # 1 year
@@ -154,6 +189,19 @@ TRACKING_GEOIP_ENDPOINT = os.getenv('TRACKING_GEOIP_ENDPOINT', 'https://ipapi.co
 TRACKING_GEOIP_TIMEOUT = 2
 TRACKING_IGNORED_PATH_PREFIXES = ['/static/', '/media/', '/favicon.ico', '/admin/jsi18n/']
 
+# ============================================================================
+# OPTIONAL REQUEST PROFILING (django-silk)
+# ============================================================================
+# Development-only profiler used to validate query counts and per-view CPU
+# time. Install with: pip install django-silk, then run with
+# ENABLE_SILK_PROFILING=1. Must stay off in production.
+ENABLE_SILK_PROFILING = os.getenv('ENABLE_SILK_PROFILING') == '1'
+if ENABLE_SILK_PROFILING:
+    INSTALLED_APPS.append('silk')
+    MIDDLEWARE.insert(0, 'silk.middleware.SilkyMiddleware')
+    SILKY_PYTHON_PROFILER = True
+    SILKY_PYTHON_PROFILER_BINARY = True  # dump .prof files for snakeviz
+
 # ============================================================================
 # SECURITY SETTINGS FOR BOT PROTECTION AND RATE LIMITING
 # ============================================================================
@@ -201,6 +249,14 @@ ALLOWED_REDIRECTS = [
     'signup_login', 'verify_identity', 'my_tickets', 'events_list'
 ]
 
+# Session storage: write-through cache in front of the django_session table.
+# Most requests read the session from the cache instead of issuing a SELECT;
+# the DB copy keeps sessions valid across cache restarts. The booking flow
+# itself no longer touches the session (signed seat-selection cookie), so
+# what remains here is auth plus the occasional redirect target.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'default'
+
 # Session security
 SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_HTTPONLY = True
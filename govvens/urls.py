@@ -18,17 +18,25 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.http import HttpResponse, Http404
+from django.http import HttpResponse, HttpResponseNotModified, Http404
+from django.utils.http import http_date
+from django.views.decorators.cache import cache_control
 import os
 
+# robots.txt is hit constantly by crawlers; read it once at import instead
+# of touching the filesystem per request.
+_ROBOTS_PATH = os.path.join(settings.BASE_DIR, 'static', 'robots.txt')
+_ROBOTS_BODY = None
+if os.path.exists(_ROBOTS_PATH):
+    with open(_ROBOTS_PATH, 'rb') as f:
+        _ROBOTS_BODY = f.read()
+
 # Security file serving views
+@cache_control(max_age=86400)
 def serve_robots(request):
     """Serve robots.txt"""
-    file_path = os.path.join(settings.BASE_DIR, 'static', 'robots.txt')
-    if os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            content = f.read()
-        return HttpResponse(content, content_type='text/plain')
+    if _ROBOTS_BODY is not None:
+        return HttpResponse(_ROBOTS_BODY, content_type='text/plain')
     raise Http404("robots.txt not found")
 
 def serve_security_txt(request):
@@ -40,14 +48,26 @@ def serve_security_txt(request):
         return HttpResponse(content, content_type='text/plain')
     raise Http404("security.txt not found")
 
+@cache_control(max_age=300)
 def serve_sitemap(request):
-    """Serve sitemap.xml"""
+    """Serve sitemap.xml with conditional-GET support.
+
+    Crawlers poll this URL aggressively; validating against the file's
+    mtime lets unchanged polls end as a 304 without reading the file.
+    """
     file_path = os.path.join(settings.BASE_DIR, 'static', 'sitemap.xml')
-    if os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            content = f.read()
-        return HttpResponse(content, content_type='application/xml')
-    raise Http404("sitemap.xml not found")
+    if not os.path.exists(file_path):
+        raise Http404("sitemap.xml not found")
+    mtime = os.path.getmtime(file_path)
+    etag = f'"{int(mtime)}"'
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = HttpResponseNotModified()
+    else:
+        with open(file_path, 'rb') as f:
+            response = HttpResponse(f.read(), content_type='application/xml')
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(mtime)
+    return response
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -61,6 +81,10 @@ urlpatterns = [
     path('sitemap.xml', serve_sitemap),
 ]
 
+# django-silk profiling UI (development only, see settings.ENABLE_SILK_PROFILING)
+if settings.ENABLE_SILK_PROFILING:
+    urlpatterns.append(path('silk/', include('silk.urls', namespace='silk')))
+
 # Serve static and media files
 # Note: In production with DEBUG=False, you should use a web server (nginx/apache) 
 # or install whitenoise. For now, we serve static files via Django in both modes.
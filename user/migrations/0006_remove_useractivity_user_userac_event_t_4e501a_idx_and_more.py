@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-08-31 23:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0005_merge_20251125_1934'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='useractivity',
+            name='user_userac_event_t_4e501a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='user_userse_is_auth_f54dd0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['event_type', '-timestamp'], name='user_userac_event_t_3a9e8a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['session', '-timestamp'], name='user_userac_session_2d9821_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['-started_at'], name='user_userse_started_695c6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['is_authenticated', '-started_at'], name='user_userse_is_auth_a7fbe3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['is_bot'], name='user_userse_is_bot_d40ac1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['device_type'], name='user_userse_device__a3d3b5_idx'),
+        ),
+    ]
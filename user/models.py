@@ -3,7 +3,10 @@ import uuid
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 class User(AbstractUser):
@@ -57,6 +60,13 @@ class NotificationSubscription(models.Model):
         return f"{self.user.phone} - {self.event.name}"
 
 
+@receiver(post_save, sender=NotificationSubscription)
+@receiver(post_delete, sender=NotificationSubscription)
+def clear_subscription_cache(sender, instance, **kwargs):
+    """Drop the cached event_detail subscription flag when a subscription changes"""
+    cache.delete(f'sub:{instance.user_id}:{instance.event_id}')
+
+
 class UserSession(models.Model):
     """
     Server-side representation of a single browser/device session.
@@ -118,9 +128,14 @@ class UserSession(models.Model):
 
     class Meta:
         ordering = ["-started_at"]
+        # The dashboard lists order by -started_at (optionally filtered on
+        # auth state), and the stats panels group by device_type / is_bot.
         indexes = [
             models.Index(fields=["visitor_id", "started_at"]),
-            models.Index(fields=["is_authenticated"]),
+            models.Index(fields=["-started_at"]),
+            models.Index(fields=["is_authenticated", "-started_at"]),
+            models.Index(fields=["is_bot"]),
+            models.Index(fields=["device_type"]),
         ]
 
     def __str__(self):
@@ -194,10 +209,13 @@ class UserActivity(models.Model):
 
     class Meta:
         ordering = ["-timestamp"]
+        # Activity lists order by -timestamp, filter by event_type, and the
+        # session detail page reads one session's activities newest-first.
         indexes = [
-            models.Index(fields=["event_type"]),
+            models.Index(fields=["event_type", "-timestamp"]),
             models.Index(fields=["timestamp"]),
             models.Index(fields=["response_time_ms"]),
+            models.Index(fields=["session", "-timestamp"]),
         ]
 
     def __str__(self):
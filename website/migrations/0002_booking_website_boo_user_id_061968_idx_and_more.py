@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-31 22:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', 'payment_status', '-booking_time'], name='website_boo_user_id_061968_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_active', 'date', 'time'], name='website_eve_is_acti_7bf33b_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-31 23:08
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0002_booking_website_boo_user_id_061968_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='booking',
+            new_name='booking_user_status_time_idx',
+            old_name='website_boo_user_id_061968_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='event',
+            new_name='event_active_date_idx',
+            old_name='website_eve_is_acti_7bf33b_idx',
+        ),
+    ]
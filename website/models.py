@@ -1,7 +1,15 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from user.models import User
 
+# Cache keys for the event-listing pages; invalidated whenever an Event
+# changes so the views can serve cached data with a short TTL safely.
+LANDING_FEATURED_CACHE_KEY = 'landing:featured'
+EVENTS_LIST_CACHE_KEY = 'events:list:v1'
+
 class Event(models.Model):
     name = models.CharField(max_length=255)
     date = models.DateField()
@@ -13,9 +21,28 @@ class Event(models.Model):
     available_seats = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        # Backs Event.objects.filter(is_active=True).order_by('date', 'time')
+        # used by the landing page and events list.
+        indexes = [
+            models.Index(fields=['is_active', 'date', 'time'],
+                         name='event_active_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} on {self.date} at {self.time}"
 
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def clear_event_list_caches(sender, instance, **kwargs):
+    """Drop cached event listings whenever an Event is created/updated/deleted"""
+    cache.delete_many([
+        LANDING_FEATURED_CACHE_KEY,
+        EVENTS_LIST_CACHE_KEY,
+        f'event:{instance.pk}:dict',
+    ])
+
+
 class SeatMap(models.Model):
     event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='seat_map')
     # For MVP: store seat map as JSON string (static layout)
@@ -41,6 +68,12 @@ class Booking(models.Model):
 
     class Meta:
         unique_together = ('event', 'seat_block', 'row', 'seat_number')
+        # Backs the "my tickets" lookup: filter on user (+ payment status)
+        # ordered by most recent booking first.
+        indexes = [
+            models.Index(fields=['user', 'payment_status', '-booking_time'],
+                         name='booking_user_status_time_idx'),
+        ]
 
     def __str__(self):
         return f"Booking {self.id} by {self.user.phone} for {self.event.name}"
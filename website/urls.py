@@ -37,6 +37,8 @@ urlpatterns = [
     path('dashboard/', views.dashboard, name='dashboard'),
     path('dashboard/delete-user/<int:user_id>/', views.delete_user, name='delete_user'),
     path('dashboard/toggle-user/<int:user_id>/', views.toggle_user_status, name='toggle_user_status'),
+    path('dashboard/bulk-toggle-users/', views.bulk_toggle_users, name='bulk_toggle_users'),
+    path('dashboard/bulk-delete-users/', views.bulk_delete_users, name='bulk_delete_users'),
     path('dashboard/export-excel/', views.export_users_excel, name='export_users_excel'),
     
     # User Sessions Dashboard